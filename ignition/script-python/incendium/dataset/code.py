@@ -4,11 +4,18 @@ from __future__ import unicode_literals
 
 __all__ = ["from_list_of_dicts", "to_json", "to_jsonobject", "to_xml"]
 
+from xml.sax.saxutils import escape
+
 import system.dataset
-import system.date
 from com.inductiveautomation.ignition.common import Dataset
+from java.time import Instant, ZoneId
+from java.time.format import DateTimeFormatter
 from java.util import Date
 
+# DateTimeFormatter is immutable and thread-safe, so a single instance
+# can be shared instead of parsing the pattern for every Date value.
+_ISO_FORMATTER = DateTimeFormatter.ofPattern("yyyy-MM-dd'T'HH:mm:ss.SSSXXX")
+
 
 class _NanoXML(object):
     def __init__(self, root="root", indent="\t"):
@@ -22,9 +29,8 @@ class _NanoXML(object):
         self.root = root
         self.indent = indent
         self._new_line = "\n"
-        self._output = "<{root}>{new_line}".format(
-            root=self.root, new_line=self._new_line
-        )
+        self._indent2 = indent * 2
+        self._parts = ["<", self.root, ">", self._new_line]
 
     def add_element(self, name):
         """Add an element to the XML document.
@@ -32,22 +38,29 @@ class _NanoXML(object):
         Args:
             name (str): The name of the element.
         """
-        self._output += "{indent}<{name}>{new_line}".format(
-            indent=self.indent, name=name, new_line=self._new_line
-        )
+        self._parts.extend((self.indent, "<", name, ">", self._new_line))
 
     def add_sub_element(self, name, value):
         """Add a sub element to an element.
 
+        The value is XML-escaped before being written.
+
         Args:
             name (str): The name of the sub element.
             value (object): The value of the sub element.
         """
-        self._output += "{indent}<{name}>{value}</{name}>{new_line}".format(
-            indent=self.indent * 2,
-            value=value,
-            new_line=self._new_line,
-            name=name,
+        self._parts.extend(
+            (
+                self._indent2,
+                "<",
+                name,
+                ">",
+                escape("{}".format(value)),
+                "</",
+                name,
+                ">",
+                self._new_line,
+            )
         )
 
     def close_element(self, name):
@@ -56,9 +69,7 @@ class _NanoXML(object):
         Args:
             name (str): The name of the element.
         """
-        self._output += "{indent}</{name}>{new_line}".format(
-            indent=self.indent, name=name, new_line=self._new_line
-        )
+        self._parts.extend((self.indent, "</", name, ">", self._new_line))
 
     def to_string(self):
         """Return the string representation of the XML document.
@@ -66,24 +77,7 @@ class _NanoXML(object):
         Returns:
             str: The string representation of the XML document.
         """
-        self._output += "</{}>".format(self.root)
-        return self._output
-
-
-def _format_object(obj):
-    """Format the value to be properly represented in JSON.
-
-    Args:
-        obj (object): The value to format.
-        header (str): Column name used for nested Datasets.
-
-    Returns:
-        str: The string representation of the value.
-    """
-    _obj = obj
-    if isinstance(obj, Dataset):
-        _obj = _to_jsonobject(obj)
-    return _obj
+        return "".join(self._parts) + "</" + self.root + ">"
 
 
 def _format_value(obj, header=""):
@@ -102,7 +96,11 @@ def _format_value(obj, header=""):
     elif isinstance(obj, basestring):
         _obj = '"{}"'.format(obj)
     elif isinstance(obj, Date):
-        _obj = '"{}"'.format(system.date.format(obj, "yyyy-MM-dd'T'HH:mm:ss.SSSXXX"))
+        _obj = '"{}"'.format(
+            _ISO_FORMATTER.format(
+                Instant.ofEpochMilli(obj.getTime()).atZone(ZoneId.systemDefault())
+            )
+        )
     elif isinstance(obj, Dataset):
         _obj = _to_json(obj, header, False)
     else:
@@ -124,31 +122,34 @@ def _to_json(dataset, root, is_root=True):
     Returns:
         str: The string JSON representation of the dataset.
     """
-    headers = dataset.getColumnNames()
-    columns = dataset.getColumnCount()
-    rows = dataset.getRowCount()
-    data = system.dataset.toPyDataSet(dataset)
-    ret_str = ("{" if is_root and root is not None else "") + (
-        '"{}":['.format(root) if root is not None else "["
-    )
-    col_count = 0
-
-    for row_count, row in enumerate(data, start=1):
-        ret_str += "{"
-        for header in headers:
-            col_count += 1
-            val = _format_value(row[header], header)
-            comma = "," if col_count < columns else ""
-            if isinstance(row[header], Dataset):
-                ret_str += "{}{}".format(val, comma)
+    headers = tuple(dataset.getColumnNames())
+    last_col = dataset.getColumnCount() - 1
+    last_row = dataset.getRowCount() - 1
+    header_prefixes = ['"{}":'.format(header) for header in headers]
+    parts = []
+    append = parts.append
+    if is_root and root is not None:
+        append("{")
+    append('"{}":['.format(root) if root is not None else "[")
+
+    for ri, row in enumerate(system.dataset.toPyDataSet(dataset)):
+        append("{")
+        for ci, cell in enumerate(row):
+            val = _format_value(cell, headers[ci])
+            if isinstance(cell, Dataset):
+                append(val)
             else:
-                ret_str += '"{}":{}{}'.format(header, val, comma)
-        ret_str += "{}{}".format("}", "," if row_count < rows else "")
-        col_count = 0
-    ret_str += "]"
-    ret_str += "}" if is_root and root is not None else ""
+                append(header_prefixes[ci] + val)
+            if ci != last_col:
+                append(",")
+        append("}")
+        if ri != last_row:
+            append(",")
+    append("]")
+    if is_root and root is not None:
+        append("}")
 
-    return ret_str
+    return "".join(parts)
 
 
 def _to_jsonobject(dataset):
@@ -160,17 +161,14 @@ def _to_jsonobject(dataset):
     Returns:
         list[dict]: The Dataset as a Python object.
     """
-    data = []
     headers = dataset.getColumnNames()
-    row_count = dataset.getRowCount()
-
-    for i in range(row_count):
-        row_dict = {
-            header: _format_object(dataset.getValueAt(i, header)) for header in headers
+    return [
+        {
+            header: _to_jsonobject(value) if isinstance(value, Dataset) else value
+            for header, value in zip(headers, row)
         }
-        data.append(row_dict)
-
-    return data
+        for row in system.dataset.toPyDataSet(dataset)
+    ]
 
 
 def from_list_of_dicts(list_of_dicts):
@@ -182,17 +180,8 @@ def from_list_of_dicts(list_of_dicts):
     Returns:
         Dataset: A Dataset representation of the list of dictionaries.
     """
-    keys_set = set()
-    headers = list(keys_set.union(*(d.keys() for d in list_of_dicts)))
-    data = []
-    for dict_ in list_of_dicts:
-        row = []
-        for header in headers:
-            if header in dict_.keys():
-                row.append(dict_[header])
-            else:
-                row.append(None)
-        data.append(row)
+    headers = list(set().union(*list_of_dicts))
+    data = [[dict_.get(header) for header in headers] for dict_ in list_of_dicts]
     return system.dataset.toDataSet(headers, data)
 
 
@@ -237,13 +226,12 @@ def to_xml(dataset, root="root", element="row", indent="\t"):
         str: The string XML representation of the dataset.
     """
     headers = dataset.getColumnNames()
-    row_count = dataset.getRowCount()
     xml = _NanoXML(root, indent)
 
-    for i in range(row_count):
+    for row in system.dataset.toPyDataSet(dataset):
         xml.add_element(element)
         for header in headers:
-            xml.add_sub_element(header, dataset.getValueAt(i, header))
+            xml.add_sub_element(header, row[header])
         xml.close_element(element)
 
     return xml.to_string()
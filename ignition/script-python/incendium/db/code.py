@@ -14,7 +14,6 @@ __all__ = [
 
 import system.db
 import system.util
-from com.inductiveautomation.ignition.common import BasicDataset
 from java.lang import Thread
 
 
@@ -33,7 +32,10 @@ class DisposableConnection(object):
             database (str): The name of the database connection in
                 Ignition.
             retries (int): The number of additional times to retry
-                enabling the connection. Optional.
+                enabling the connection, each allowing about one second
+                of waiting. Within that budget the status is polled with
+                a delay that starts at 50 ms and doubles up to 1 s.
+                Optional.
         """
         super(DisposableConnection, self).__init__()
         self._database = database
@@ -55,19 +57,23 @@ class DisposableConnection(object):
         """Enter the runtime context related to this object."""
         system.db.setDatasourceEnabled(self.database, True)
 
-        for _ in range(self._retries):
-            Thread.sleep(1000)
-            if self.status == "Valid":
+        delay = 50
+        remaining = self._retries * 1000
+        while remaining > 0:
+            wait = min(delay, remaining)
+            Thread.sleep(wait)
+            remaining -= wait
+            status = self.status
+            if status == "Valid":
                 if self._global_conn not in system.util.globals:
                     system.util.globals[self._global_conn] = 0
                 system.util.globals[self._global_conn] += 1
                 break
-            if self.status == "Faulted":
+            if status == "Faulted":
                 raise IOError(
-                    "The database connection {!r} is {}.".format(
-                        self._database, self.status
-                    )
+                    "The database connection {!r} is {}.".format(self._database, status)
                 )
+            delay = min(delay * 2, 1000)
         else:
             raise IOError(
                 "The database connection {!r} could not be enabled.".format(
@@ -212,13 +218,13 @@ def _execute_sp(
         skipAudit=skip_audit,
     )
 
-    if in_params is not None:
+    if in_params:
         for i_param in in_params:
             call.registerInParam(
                 i_param.name_or_index, i_param.type_code, i_param.value
             )
 
-    if out_params is not None:
+    if out_params:
         for o_param in out_params:
             call.registerOutParam(o_param.name_or_index, o_param.type_code)
 
@@ -228,15 +234,15 @@ def _execute_sp(
     system.db.execSProcCall(call)
 
     _out_params = {}
-    if out_params is not None and get_out_params:
-        for o_param in out_params:
-            _out_params[o_param.name_or_index] = call.getOutParamValue(
-                o_param.name_or_index
-            )
+    if out_params and get_out_params:
+        _out_params = {
+            o_param.name_or_index: call.getOutParamValue(o_param.name_or_index)
+            for o_param in out_params
+        }
 
     return {
         "output_params": _out_params,
-        "result_set": call.getResultSet() if get_result_set else BasicDataset(),
+        "result_set": call.getResultSet() if get_result_set else None,
         "return_value": call.getReturnValue() if get_ret_val else None,
         "update_count": call.getUpdateCount() if get_update_count else -1,
     }
@@ -297,7 +303,7 @@ def check(stored_procedure, database="", params=None):
         stored_procedure, output=[output], database=database, params=params
     )
 
-    return output_params["flag"] if "flag" in output_params.iterkeys() else None
+    return output_params.get("flag")
 
 
 def execute_non_query(stored_procedure, database="", transaction=None, params=None):
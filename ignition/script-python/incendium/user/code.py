@@ -30,7 +30,9 @@ class IncendiumUser(object):
         """
         super(IncendiumUser, self).__init__()
         self._contact_info = user.getContactInfo()
-        self._email = None
+        self._email = [
+            ci.value for ci in self._contact_info if ci.contactType == "email"
+        ]
         self._first_name = user.get(user.FirstName)
         self._last_name = user.get(user.LastName)
         self._locale = user.getOrDefault(user.Language)
@@ -52,7 +54,7 @@ class IncendiumUser(object):
         Returns:
             list[str]: User's email address(es).
         """
-        return [ci.value for ci in self._contact_info if ci.contactType == "email"]
+        return self._email
 
     @property
     def first_name(self):
@@ -70,7 +72,7 @@ class IncendiumUser(object):
         Returns:
             str: User's full name.
         """
-        return " ".join([self._first_name, self._last_name])
+        return self._first_name + " " + self._last_name
 
     @property
     def last_name(self):
@@ -115,11 +117,9 @@ def get_users(user_source="", filter_role=""):
         list[PyUser]: A list of PyUser objects.
     """
     users = system.user.getUsers(user_source)
-    return (
-        [user for user in users if filter_role in user.getRoles()]
-        if filter_role
-        else users
-    )
+    if not filter_role:
+        return users
+    return [user for user in users if filter_role in user.getRoles()]
 
 
 def get_emails(user_source="", filter_role=""):
@@ -136,12 +136,8 @@ def get_emails(user_source="", filter_role=""):
     Returns:
         list[str]: A list of email addresses.
     """
-    emails = set()
     users = [IncendiumUser(user) for user in get_users(user_source, filter_role)]
-    for user in users:
-        for email in user.email:
-            emails.add(email)
-    return sorted(list(emails))
+    return sorted({email for user in users for email in user.email})
 
 
 def get_user(user_source="", failover=None):
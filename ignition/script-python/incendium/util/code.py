@@ -8,31 +8,88 @@ __all__ = [
     "validate_form",
 ]
 
-import traceback
+import itertools
+import sys
 
 import system.date
 import system.util
+from java.lang import System
 from java.util import Date
 
 from incendium import constants
 from incendium.user import IncendiumUser
 
+_DEFAULT_LANGUAGE = constants.DEFAULT_LANGUAGE
+_EMPTY_STRING = constants.EMPTY_STRING
+_NEW_TABBED_LINE = constants.NEW_TABBED_LINE
+_TABBED_LINE = constants.TABBED_LINE
 
-def _format_error_message(counter, error_message, key):
-    """Format error message.
+_HMS_FMT = "{:02d}:{:02d}:{:02d}".format
+_PAD2 = tuple("{:02d}".format(i) for i in range(100))
+_SECS_PER_HOUR = 3600
+_SECS_PER_MIN = 60
+
+_date_now = system.date.now
+_seconds_between = system.date.secondsBetween
+
+
+def _iter_items(numbers, collections):
+    """Iterate over the items of numbers and collections.
+
+    When a key is present in both, the value in collections wins.
+
+    Args:
+        numbers (dict): A dictionary of numbers. Optional.
+        collections (dict): A dictionary of collections. Optional.
+
+    Returns:
+        iterable: The (key, value) pairs to validate.
+    """
+    if numbers and collections:
+        return itertools.chain(
+            (
+                (key, num_val)
+                for key, num_val in numbers.iteritems()
+                if key not in collections
+            ),
+            collections.iteritems(),
+        )
+    if numbers:
+        return numbers.iteritems()
+    if collections:
+        return collections.iteritems()
+    return ()
+
+
+def _secs_since_date(date):
+    """Get the seconds elapsed from a date until now.
 
     Args:
-        counter (int): Number of detected errors.
-        error_message (str): Error message.
-        key (str): Dictionary key.
+        date (Date): The date.
 
     Returns:
-        str: Formatted error message.
+        int: Seconds elapsed.
     """
-    error_message += (
-        constants.TABBED_LINE + key if counter == 1 else constants.NEW_TABBED_LINE + key
-    )
-    return error_message
+    return _seconds_between(date, _date_now())
+
+
+def _secs_since_millis(millis):
+    """Get the seconds elapsed from a date in milliseconds until now.
+
+    Args:
+        millis (int): A date represented in milliseconds.
+
+    Returns:
+        int: Seconds elapsed.
+    """
+    return (System.currentTimeMillis() - millis) // 1000
+
+
+_TIMER_DISPATCH = {
+    Date: _secs_since_date,
+    int: _secs_since_millis,
+    long: _secs_since_millis,
+}
 
 
 def get_function_name():
@@ -41,7 +98,7 @@ def get_function_name():
     Returns:
         str: Function's name.
     """
-    return traceback.extract_stack(None, 2)[0][2]
+    return sys._getframe(1).f_code.co_name  # pylint: disable=protected-access
 
 
 def get_timestamp(value):
@@ -54,9 +111,11 @@ def get_timestamp(value):
         str: Time elapsed represented by a string in the following
             format: "hh:mm:ss".
     """
-    minutes, seconds = divmod(value, 60)
-    hours, minutes = divmod(minutes, 60)
-    return "{:02d}:{:02d}:{:02d}".format(hours, minutes, seconds)
+    hours, rem = divmod(value, _SECS_PER_HOUR)
+    minutes, seconds = divmod(rem, _SECS_PER_MIN)
+    if 0 <= hours < 100:
+        return _PAD2[hours] + ":" + _PAD2[minutes] + ":" + _PAD2[seconds]
+    return _HMS_FMT(hours, minutes, seconds)
 
 
 def get_timer(date):
@@ -69,24 +128,29 @@ def get_timer(date):
          str: Time elapsed represented by a string in the following
             format: "hh:mm:ss".
     """
-    date_1 = date if isinstance(date, Date) else system.date.fromMillis(date)
-    date_2 = system.date.now()
-    return get_timestamp(system.date.secondsBetween(date_1, date_2))
+    handler = _TIMER_DISPATCH.get(type(date))
+    if handler is None:
+        handler = _secs_since_date if isinstance(date, Date) else _secs_since_millis
+    return get_timestamp(handler(date))
 
 
 def set_locale(user):
     """Set the Locale to the user's default Language.
 
-    If none is configured, the default will be English (US).
+    If none is configured, the default will be English (US). The call
+    is skipped if the current Locale already matches.
 
     Args:
         user (IncendiumUser): The User.
     """
-    locale = (
-        user.locale if user is not None and user.locale else constants.DEFAULT_LANGUAGE
-    )
+    locale = _DEFAULT_LANGUAGE
+    if user is not None:
+        user_locale = user.locale
+        if user_locale:
+            locale = user_locale
 
-    system.util.setLocale(locale)
+    if locale != system.util.getLocale():
+        system.util.setLocale(locale)
 
 
 def validate_form(strings=None, numbers=None, collections=None):
@@ -107,28 +171,22 @@ def validate_form(strings=None, numbers=None, collections=None):
             error_message (str): Error message in case any validation
                 test has failed.
     """
-    is_valid = True
-    error_message = constants.EMPTY_STRING
-    counter = 0
+    if not (strings or numbers or collections):
+        return True, _EMPTY_STRING
+
+    failed = []
 
     if strings:
         for key, str_val in strings.iteritems():
             if not str_val:
-                counter += 1
-                error_message = _format_error_message(counter, error_message, key)
-                is_valid = False
+                failed.append(key)
 
-    merged_dict = {}
-    if numbers:
-        merged_dict.update(numbers)
-    if collections:
-        merged_dict.update(collections)
+    for key, num_val in _iter_items(numbers, collections):
+        if num_val is None or num_val <= 0:
+            failed.append(key)
 
-    if merged_dict:
-        for key, num_val in merged_dict.iteritems():
-            if num_val is None or num_val <= 0:
-                counter += 1
-                error_message = _format_error_message(counter, error_message, key)
-                is_valid = False
+    error_message = _EMPTY_STRING
+    if failed:
+        error_message = _TABBED_LINE + _NEW_TABBED_LINE.join(failed)
 
-    return is_valid, error_message
+    return not failed, error_message